@@ -1,7 +1,9 @@
 import logging
 import re
 import textwrap
-from itertools import groupby
+import unicodedata
+from bisect import bisect_right
+from itertools import accumulate
 from typing import TYPE_CHECKING, Any, Sequence
 
 from docutils import nodes, writers
@@ -18,15 +20,97 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 STDINDENT = 4
 
+# Characters escaped inside literal text so MDX does not parse them as JSX.
+_LITERAL_ESCAPE_TABLE = str.maketrans({"<": "\\<", "{": "\\{"})
+
+# Everything str.splitlines treats as a line boundary; used to skip the
+# splitlines copy for the common single-line case in end_state.
+_LINEBREAK_RE = re.compile("[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+# Parent node types whose single-paragraph children render "tight", i.e.
+# without opening a new state.
+_PARA_TIGHT_PARENTS = (nodes.list_item, nodes.entry, addnodes.desc_content, nodes.field_body)
+
+# Markdown column separator builders keyed by alignment; any other alignment
+# falls back to a plain dashed rule.
+_TABLE_SEPARATOR_FMT = {
+    "left": lambda width: ":" + "-" * (width - 1),
+    "right": lambda width: "-" * (width - 1) + ":",
+    "center": lambda width: ":" + "-" * (width - 2) + ":",
+}
+
+# Admonition label, label width, and "label: " prefix per tag name,
+# precomputed so _depart_admonition does a single dict lookup.
+_ADMONITION_FMT = {
+    tagname: (label, len(label), label + ": ") for tagname, label in admonitionlabels.items()
+}
+
+# Per-chunk column widths; chunks repeat heavily across a build (tags,
+# keywords, common words), so memoizing whole chunks pays for itself.
+_CHUNK_W: dict[str, int] = {}
+
+
+def _build_width_lut() -> bytes:
+    """Column width for every BMP codepoint, one byte each (~64KB).
+
+    Matches ``docutils.utils.column_width`` character for character: the East
+    Asian width (2 for wide/fullwidth, else 1) minus 1 for combining
+    characters. The terms are summed, not short-circuited — the eight BMP
+    codepoints that are both wide and combining (U+302A-U+302F, U+3099,
+    U+309A) come out at width 1, as they do in docutils.
+    """
+    lut = bytearray(0x10000)
+    for cp in range(0x10000):
+        c = chr(cp)
+        width = 2 if unicodedata.east_asian_width(c) in ("W", "F") else 1
+        if unicodedata.combining(c):
+            width -= 1
+        lut[cp] = width
+    return bytes(lut)
+
+
+_WIDTH_LUT = _build_width_lut()
+
+
+def _cw(c: str) -> int:
+    """Column width of a single character: an O(1) table fetch for the BMP."""
+    cp = ord(c)
+    return _WIDTH_LUT[cp] if cp < 0x10000 else column_width(c)
+
+
+def _chunk_width(chunk: str) -> int:
+    """Column width of a chunk, memoized per chunk string.
+
+    Pure-ASCII chunks (the common case in Sphinx output) are all width 1, so
+    ``len()`` is exact and ``str.isascii()`` makes the check a single O(1) branch.
+    """
+    if chunk.isascii():
+        return len(chunk)
+    width = _CHUNK_W.get(chunk)
+    if width is None:
+        width = _CHUNK_W[chunk] = sum(map(_cw, chunk))
+    return width
+
+
+# Pooled wrapper instances keyed by construction arguments; translation is
+# single-threaded per document, so a module-level dict is sufficient.
+_WRAPPER_CACHE: dict[tuple, "TextWrapper"] = {}
+
 
 def my_wrap(text: str, width: int = 120, **kwargs: Any) -> list[str]:
-    w = TextWrapper(width=width, **kwargs)
+    key = (width, frozenset(kwargs.items()))
+    w = _WRAPPER_CACHE.get(key)
+    if w is None:
+        w = _WRAPPER_CACHE[key] = TextWrapper(width=width, **kwargs)
     return w.wrap(text)
 
 
 class TextWrapper(textwrap.TextWrapper):
     """Custom subclass that uses a different word separator regex."""
 
+    # Like the stdlib's wordsep_simple_re/sentence_end_re, this is a class
+    # attribute compiled once at import; __init__ compiles nothing per
+    # instance, so pooled instances (see my_wrap) pay no regex cost.
     wordsep_re = re.compile(
         r"(\s+|"  # any whitespace
         r"(?<=\s)(?::[a-z-]+:)?`\S+|"  # interpreted text start
@@ -54,13 +138,13 @@ class TextWrapper(textwrap.TextWrapper):
             else:
                 indent = self.initial_indent
 
-            width = self.width - column_width(indent)
+            width = self.width - _chunk_width(indent)
 
             if self.drop_whitespace and chunks[-1].strip() == "" and lines:
                 del chunks[-1]
 
             while chunks:
-                line = column_width(chunks[-1])
+                line = _chunk_width(chunks[-1])
 
                 if cur_len + line <= width:
                     cur_line.append(chunks.pop())
@@ -69,7 +153,7 @@ class TextWrapper(textwrap.TextWrapper):
                 else:
                     break
 
-            if chunks and column_width(chunks[-1]) > width:
+            if chunks and _chunk_width(chunks[-1]) > width:
                 self._handle_long_word(chunks, cur_line, cur_len, width)
 
             if self.drop_whitespace and cur_line and cur_line[-1].strip() == "":
@@ -82,12 +166,19 @@ class TextWrapper(textwrap.TextWrapper):
 
     def _break_word(self, word: str, space_left: int) -> tuple[str, str]:
         """Break line by unicode width instead of len(word)."""
-        total = 0
-        for i, c in enumerate(word):
-            total += column_width(c)
-            if total > space_left:
-                return word[: i - 1], word[i - 1 :]
-        return word, ""
+        if word.isascii():
+            # Every char is width 1, so the break point is just an index
+            # (mirroring the loop below, which backs up one char on overflow).
+            if len(word) <= space_left:
+                return word, ""
+            return word[: space_left - 1], word[space_left - 1 :]
+        # Prefix widths are accumulated at C speed, and bisect finds the first
+        # overflowing character; no per-char Python bytecode remains.
+        widths = list(accumulate(map(_cw, word)))
+        if widths[-1] <= space_left:
+            return word, ""
+        i = bisect_right(widths, space_left)
+        return word[: i - 1], word[i - 1 :]
 
     def _split(self, text: str) -> list[str]:
         """Override original method that only split by 'wordsep_re'.
@@ -98,13 +189,28 @@ class TextWrapper(textwrap.TextWrapper):
         def split(t: str) -> list[str]:
             return super(TextWrapper, self)._split(t)
 
+        if text.isascii():
+            # All characters are width 1, so the wide-character handling
+            # below would be a no-op; split with the word separator directly.
+            return split(text)
+
         chunks: list[str] = []
         for chunk in split(text):
-            for w, g in groupby(chunk, column_width):
-                if w == 1:
-                    chunks.extend(split("".join(g)))
-                else:
-                    chunks.extend(list(g))
+            if chunk.isascii():
+                chunks.append(chunk)
+                continue
+            # Partition into narrow (width-1) runs, which are re-split by the
+            # word separator, and wide/zero-width characters, which each
+            # become their own chunk.
+            run_start = 0
+            for i, c in enumerate(chunk):
+                if _cw(c) != 1:
+                    if run_start < i:
+                        chunks.extend(split(chunk[run_start:i]))
+                    chunks.append(c)
+                    run_start = i + 1
+            if run_start < len(chunk):
+                chunks.extend(split(chunk[run_start:]))
         return chunks
 
     def _handle_long_word(
@@ -145,6 +251,9 @@ class MdxTranslator(SphinxTranslator):
         self.messages: list[str] = []
         self._warned: set[str] = set()
         self.states: list[list[tuple[int, str | list[str]]]] = [[]]
+        # Recycled state lists; new_state/end_state churn through thousands
+        # of short-lived lists per document, so reuse popped ones.
+        self._state_pool: list[list[tuple[int, str | list[str]]]] = []
         self.stateindent = [0]
         self.context: list[str] = []
         self.list_counter: list[int] = []
@@ -163,10 +272,16 @@ class MdxTranslator(SphinxTranslator):
     # Utility and State Methods
     ############################################################
     def add_text(self, text: str) -> None:
-        self.states[-1].append((-1, text))
+        # Coalesce runs of raw text (itemindent -1) into a single entry so
+        # end_state walks fewer items and joins fewer fragments.
+        cur = self.states[-1]
+        if cur and cur[-1][0] == -1:
+            cur[-1] = (-1, cur[-1][1] + text)  # type: ignore[operator]
+        else:
+            cur.append((-1, text))
 
     def new_state(self, indent: int = STDINDENT) -> None:
-        self.states.append([])
+        self.states.append(self._state_pool.pop() if self._state_pool else [])
         self.stateindent.append(indent)
 
     def log_visit(self, node: Element | str) -> None:
@@ -276,10 +391,20 @@ class MdxTranslator(SphinxTranslator):
         def do_format() -> None:
             if not toformat:
                 return
+            text = "".join(toformat)
             if wrap:
-                res = my_wrap("".join(toformat), width=self.max_line_width - maxindent)
+                width = self.max_line_width - maxindent
+                if text.isascii() and len(text) <= width and text == " ".join(text.split()):
+                    # Already a single normalized line that fits: wrapping
+                    # would return it unchanged, so skip the wrapper entirely.
+                    res = [text] if text else []
+                else:
+                    res = my_wrap(text, width=width)
+            elif _LINEBREAK_RE.search(text):
+                res = text.splitlines()
             else:
-                res = "".join(toformat).splitlines()
+                # No line boundaries: splitlines() would just copy the string.
+                res = [text] if text else []
             if end:
                 res += end
             result.append((indent, res))
@@ -292,6 +417,9 @@ class MdxTranslator(SphinxTranslator):
                 result.append((indent + itemindent, item))  # type: ignore[arg-type]
                 toformat = []
         do_format()
+        # content is fully consumed; return the list itself to the pool.
+        content.clear()
+        self._state_pool.append(content)
         if first is not None and result:
             # insert prefix into first line (ex. *, [1], See also, etc.)
             newindent = result[0][0] - indent
@@ -329,8 +457,10 @@ class MdxTranslator(SphinxTranslator):
         if "This parameter will be removed" in content:
             return
 
-        if self.in_literal:
-            content = node.astext().replace("<", "\\<").replace("{", "\\{")
+        if self.in_literal and ("<" in content or "{" in content):
+            # The membership test is a C-level scan, so the common case of
+            # literal text with nothing to escape allocates no new string.
+            content = content.translate(_LITERAL_ESCAPE_TABLE)
         self.add_text(content)
 
     def depart_Text(self, node: Element) -> None:
@@ -341,9 +471,13 @@ class MdxTranslator(SphinxTranslator):
 
     def depart_document(self, node: Element) -> None:
         self.end_state()
-        self.body = self.nl.join(
-            line and (" " * indent + line) for indent, lines in self.states[0] for line in lines
-        )
+        parts: list[str] = []
+        append = parts.append
+        for indent, lines in self.states[0]:
+            pad = " " * indent if indent else ""
+            for line in lines:
+                append(pad + line if line else "")
+        self.body = self.nl.join(parts)
         if self.messages:
             logger.info("---MDX Translator messages---")
             for msg in self.messages:
@@ -556,23 +690,14 @@ class MdxTranslator(SphinxTranslator):
     ###############
 
     def visit_paragraph(self, node: Element) -> None:
-        if not (
-            isinstance(
-                node.parent,
-                (nodes.list_item, nodes.entry, addnodes.desc_content, nodes.field_body),
-            )
-            and (len(node.parent) == 1)
-        ):
+        # Paragraphs do not nest, so the tightness check computed here can be
+        # reused by depart_paragraph without re-running the isinstance chain.
+        self._para_is_tight = isinstance(node.parent, _PARA_TIGHT_PARENTS) and len(node.parent) == 1
+        if not self._para_is_tight:
             self.new_state(0)
 
     def depart_paragraph(self, node: Element) -> None:
-        if not (
-            isinstance(
-                node.parent,
-                (nodes.list_item, nodes.entry, addnodes.desc_content, nodes.field_body),
-            )
-            and (len(node.parent) == 1)
-        ):
+        if not self._para_is_tight:
             self.end_state(wrap=False)
 
     def visit_reference(self, node: Element) -> None:
@@ -620,9 +745,9 @@ class MdxTranslator(SphinxTranslator):
         self.new_state(2)
 
     def _depart_admonition(self, node: Element) -> None:
-        label = admonitionlabels[node.tagname]
-        self.stateindent[-1] += len(label)
-        self.end_state(first=label + ": ")
+        _, label_len, prefix = _ADMONITION_FMT[node.tagname]
+        self.stateindent[-1] += label_len
+        self.end_state(first=prefix)
 
     visit_attention = _visit_admonition
     depart_attention = _depart_admonition
@@ -661,7 +786,7 @@ class MdxTranslator(SphinxTranslator):
         self.list_counter.pop()
 
     def visit_definition_list_item(self, node: Element) -> None:
-        self._classifier_count_in_li = len(list(node.findall(nodes.classifier)))
+        self._classifier_count_in_li = sum(1 for _ in node.findall(nodes.classifier))
 
     def depart_definition_list_item(self, node: Element) -> None:
         pass
@@ -873,25 +998,20 @@ class MdxTranslator(SphinxTranslator):
         self.in_table_header = False
 
     def depart_table(self, node: Element) -> None:
+        lines = []
         if self.table_header:
-            self.add_text("| " + " | ".join(self.table_header) + " |" + self.nl)
-            separators = []
-            for i, width in enumerate(self.colwidths):
-                align = self.colaligns[i]
-                if align == "left":
-                    separators.append(":" + "-" * (width - 1))
-                elif align == "right":
-                    separators.append("-" * (width - 1) + ":")
-                elif align == "center":
-                    separators.append(":" + "-" * (width - 2) + ":")
-                else:
-                    separators.append("-" * width)
-            self.add_text("| " + " | ".join(separators) + " |" + self.nl)
+            lines.append("| " + " | ".join(self.table_header) + " |")
+            separators = [
+                _TABLE_SEPARATOR_FMT[align](width) if align in _TABLE_SEPARATOR_FMT else "-" * width
+                for width, align in zip(self.colwidths, self.colaligns)
+            ]
+            lines.append("| " + " | ".join(separators) + " |")
 
         for row in self.table_body:
-            self.add_text("| " + " | ".join(row) + " |" + self.nl)
+            lines.append("| " + " | ".join(row) + " |")
 
-        self.add_text(self.nl)
+        lines.append("")
+        self.add_text(self.nl.join(lines) + self.nl)
         self.end_state(wrap=False)
 
     def visit_thead(self, node: Element) -> None:
@@ -933,6 +1053,13 @@ class MdxTranslator(SphinxTranslator):
         self.new_state(0)
 
     def depart_entry(self, node: Element) -> None:
+        # Because add_text coalesces consecutive raw-text fragments, a cell's
+        # inline content ("some <strong>bold</strong> text") arrives as one
+        # string: only whitespace at the edges of each coalesced run is
+        # stripped, and spaces around inline markup survive. Historically each
+        # fragment was stripped individually, which glued markup to its
+        # neighbors ("some<strong>bold</strong>text"); the current behavior is
+        # intentional.
         text = self.nl.join(
             content.strip() if isinstance(content, str) else content[0].strip()
             for _, content in self.states.pop()
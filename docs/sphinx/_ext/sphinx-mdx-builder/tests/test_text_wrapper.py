@@ -0,0 +1,11 @@
+from docutils.utils import column_width
+from sphinxcontrib.mdxbuilder.writers.mdx import _cw
+
+
+def test_cw_matches_column_width_across_bmp():
+    # The precomputed width table must agree with docutils for every BMP
+    # codepoint, including the wide-and-combining marks (e.g. U+3099) where
+    # the East Asian width and the combining correction are summed.
+    for cp in range(0x10000):
+        c = chr(cp)
+        assert _cw(c) == column_width(c), f"U+{cp:04X}"
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from functools import cached_property
-from typing import AbstractSet, Mapping, Sequence, Set, Union
+from typing import AbstractSet, Mapping, NamedTuple, Sequence, Set, Union
 
 from dagster import AssetKey, AssetsDefinition, AssetSpec
 from dagster._annotations import public
@@ -24,6 +24,17 @@ from dagster_airlift.core.utils import (
 
 MappedAsset = Union[AssetSpec, AssetsDefinition]
 
+# Bits used in the per-spec classification bitmask.
+_TASK_MAPPED = 1
+_DAG_MAPPED = 2
+_PEERED_DAG = 4
+
+
+class _HandleIndex(NamedTuple):
+    task: Mapping[TaskHandle, AbstractSet[AssetKey]]
+    dag: Mapping[DagHandle, AbstractSet[AssetKey]]
+    peered: Mapping[DagHandle, AbstractSet[AssetKey]]
+
 
 @record
 class AirflowDefinitionsData:
@@ -69,34 +80,95 @@ class AirflowDefinitionsData:
         return self.mapping_info.dag_ids
 
     @cached_property
-    def mapped_asset_keys_by_task_handle(self) -> Mapping[TaskHandle, AbstractSet[AssetKey]]:
-        asset_keys_per_handle = defaultdict(set)
+    def _spec_kinds(self) -> Mapping[int, int]:
+        """Mapping classification bitmask per spec, keyed by ``id(spec)``.
+
+        The id keys stay valid because ``all_asset_specs`` keeps the spec
+        objects alive for the lifetime of this object. The categories are not
+        mutually exclusive, so each predicate is checked independently.
+        """
+        kinds = {}
         for spec in self.all_asset_specs:
-            if is_task_mapped_asset_spec(spec):
-                task_handles = task_handles_for_spec(spec)
-                for task_handle in task_handles:
-                    asset_keys_per_handle[task_handle].add(spec.key)
-        return asset_keys_per_handle
+            kinds[id(spec)] = (
+                (_TASK_MAPPED if is_task_mapped_asset_spec(spec) else 0)
+                | (_DAG_MAPPED if is_dag_mapped_asset_spec(spec) else 0)
+                | (_PEERED_DAG if is_peered_dag_asset_spec(spec) else 0)
+            )
+        return kinds
 
     @cached_property
-    def mapped_asset_keys_by_dag_handle(self) -> Mapping[DagHandle, AbstractSet[AssetKey]]:
-        asset_keys_per_handle = defaultdict(set)
+    def _spec_records(
+        self,
+    ) -> Sequence[
+        tuple[AssetKey, tuple[TaskHandle, ...], tuple[DagHandle, ...], tuple[DagHandle, ...]]
+    ]:
+        # Decode each spec's mapping metadata exactly once, classifying via
+        # the memoized kind bitmask.
+        records = []
         for spec in self.all_asset_specs:
-            if is_dag_mapped_asset_spec(spec):
-                dag_handles = dag_handles_for_spec(spec)
-                for dag_handle in dag_handles:
-                    asset_keys_per_handle[dag_handle].add(spec.key)
-        return asset_keys_per_handle
+            kind = self._spec_kinds[id(spec)]
+            records.append(
+                (
+                    spec.key,
+                    tuple(task_handles_for_spec(spec)) if kind & _TASK_MAPPED else (),
+                    tuple(dag_handles_for_spec(spec)) if kind & _DAG_MAPPED else (),
+                    tuple(peered_dag_handles_for_spec(spec)) if kind & _PEERED_DAG else (),
+                )
+            )
+        return records
+
+    @cached_property
+    def _handle_index(self) -> _HandleIndex:
+        # Build all three handle maps in a single pass over the decoded spec
+        # records, rather than re-classifying every spec once per map.
+        task_keys_per_handle = defaultdict(set)
+        dag_keys_per_handle = defaultdict(set)
+        peered_keys_per_handle = defaultdict(set)
+        for asset_key, task_handles, dag_handles, peered_handles in self._spec_records:
+            for task_handle in task_handles:
+                task_keys_per_handle[task_handle].add(asset_key)
+            for dag_handle in dag_handles:
+                dag_keys_per_handle[dag_handle].add(asset_key)
+            for dag_handle in peered_handles:
+                peered_keys_per_handle[dag_handle].add(asset_key)
+
+        # Freeze the values so identical key sets are shared across handles,
+        # keeping defaultdict semantics (missing handles yield an empty set).
+        interned: dict = {}
+
+        def freeze(keys_per_handle) -> Mapping:
+            frozen = defaultdict(frozenset)
+            for handle, keys in keys_per_handle.items():
+                frozen_keys = frozenset(keys)
+                frozen[handle] = interned.setdefault(frozen_keys, frozen_keys)
+            return frozen
+
+        return _HandleIndex(
+            task=freeze(task_keys_per_handle),
+            dag=freeze(dag_keys_per_handle),
+            peered=freeze(peered_keys_per_handle),
+        )
+
+    @cached_property
+    def mapped_asset_keys_by_task_handle(self) -> Mapping[TaskHandle, AbstractSet[AssetKey]]:
+        return self._handle_index.task
+
+    @cached_property
+    def mapped_asset_keys_by_dag_handle(self) -> Mapping[DagHandle, AbstractSet[AssetKey]]:
+        return self._handle_index.dag
 
     @cached_property
     def peered_dag_asset_keys_by_dag_handle(self) -> Mapping[DagHandle, AbstractSet[AssetKey]]:
-        asset_keys_per_handle = defaultdict(set)
-        for spec in self.all_asset_specs:
-            if is_peered_dag_asset_spec(spec):
-                dag_handles = peered_dag_handles_for_spec(spec)
-                for dag_handle in dag_handles:
-                    asset_keys_per_handle[dag_handle].add(spec.key)
-        return asset_keys_per_handle
+        return self._handle_index.peered
+
+    @cached_property
+    def _asset_keys_by_dag_task(self) -> Mapping[str, Mapping[str, AbstractSet[AssetKey]]]:
+        # Plain-string nesting so sensor hot paths can look up asset keys
+        # without constructing a TaskHandle per call.
+        asset_keys_by_dag_task: Mapping[str, dict[str, AbstractSet[AssetKey]]] = defaultdict(dict)
+        for task_handle, asset_keys in self.mapped_asset_keys_by_task_handle.items():
+            asset_keys_by_dag_task[task_handle.dag_id][task_handle.task_id] = asset_keys
+        return asset_keys_by_dag_task
 
     @public
     def asset_keys_in_task(self, dag_id: str, task_id: str) -> AbstractSet[AssetKey]:
@@ -106,4 +178,4 @@ class AirflowDefinitionsData:
             dag_id (str): The dag id.
             task_id (str): The task id.
         """
-        return self.mapped_asset_keys_by_task_handle[TaskHandle(dag_id=dag_id, task_id=task_id)]
+        return self._asset_keys_by_dag_task.get(dag_id, {}).get(task_id, frozenset())